@@ -70,9 +70,7 @@ class AirbrakesContext:
             return
 
         # Split the data packets into estimated and raw data packets for use in processing and logging
-        est_data_packets = [
-            data_packet for data_packet in data_packets.copy() if isinstance(data_packet, EstimatedDataPacket)
-        ]
+        est_data_packets = [data_packet for data_packet in data_packets if isinstance(data_packet, EstimatedDataPacket)]
 
         # Update the processed data with the new data packets. We only care about EstimatedDataPackets
         self.data_processor.update_data(est_data_packets)
@@ -86,13 +84,17 @@ class AirbrakesContext:
 
         logged_data_packets: collections.deque[LoggedDataPacket] = collections.deque()
 
+        # The state and extension are the same for all the packets in this update, so we only look them up once
+        state_letter = self.state.name[0]
+        extension = self.current_extension.value
+
         # Makes a logged data packet for every imu data packet (raw or est), and sets the state and extension for it
         # Then, if the imu data packet is an estimated data packet, it adds the data from the corresponding processed
         # data packet
         i = 0
         for data_packet in data_packets:
             logged_data_packet = LoggedDataPacket(
-                state=self.state.name[0], extension=self.current_extension.value, timestamp=data_packet.timestamp
+                state=state_letter, extension=extension, timestamp=data_packet.timestamp
             )
             logged_data_packet.set_imu_data_packet_attributes(data_packet)
             if isinstance(data_packet, EstimatedDataPacket):
@@ -1,6 +1,6 @@
 """Module for processing IMU data on a higher level."""
 
-from collections import deque
+import math
 from collections.abc import Sequence
 
 import numpy as np
@@ -11,6 +11,17 @@ from airbrakes.data_handling.processed_data_packet import ProcessedDataPacket
 from airbrakes.utils import deadband
 from constants import ACCELERATION_NOISE_THRESHOLD
 
+# The fields of an EstimatedDataPacket that we process, laid out so that a batch of data points is stored as one
+# contiguous numpy array, with each field readable as a column. The acceleration is a 3 element sub-array so that
+# data["linear_accel"] is a (n, 3) array of the x, y, and z accelerations.
+PROCESSED_FIELDS_DTYPE = np.dtype(
+    [
+        ("timestamp", np.int64),  # in nanoseconds
+        ("linear_accel", np.float64, (3,)),  # in m/s^2
+        ("pressure_alt", np.float64),  # in meters
+    ]
+)
+
 
 class IMUDataProcessor:
     """
@@ -120,26 +131,42 @@ class IMUDataProcessor:
         if not data_points:
             return
 
-        self._data_points = data_points
-
         # We use linearAcceleration because we don't want gravity to affect our calculations for
         # speed.
-        # Next, assign variables for linear acceleration, since we don't want to recalculate them
-        # in the helper functions below:
-        # List of the acceleration in the x, y, and z directions, useful for calculations below
-        # If the absolute value of acceleration is less than 0.1, set it to 0
-        x_accel, y_accel, z_accel, pressure_altitudes = deque(), deque(), deque(), deque()
-        for data_point in self._data_points:
-            x_accel.append(deadband(data_point.estLinearAccelX, ACCELERATION_NOISE_THRESHOLD))
-            y_accel.append(deadband(data_point.estLinearAccelY, ACCELERATION_NOISE_THRESHOLD))
-            z_accel.append(deadband(data_point.estLinearAccelZ, ACCELERATION_NOISE_THRESHOLD))
-            pressure_altitudes.append(data_point.estPressureAlt)
-
-        a_x, a_y, a_z = self._compute_averages(x_accel, y_accel, z_accel)
+        # Next, we pull out all the fields we need from the data points in one pass, into a single numpy array,
+        # since we don't want to go through the data points again in the helper functions below. We know how many
+        # data points there are, so fromiter() allocates the array once and fills it in place, without building an
+        # intermediate list.
+        data = np.fromiter(
+            (
+                (
+                    data_point.timestamp,
+                    (data_point.estLinearAccelX, data_point.estLinearAccelY, data_point.estLinearAccelZ),
+                    data_point.estPressureAlt,
+                )
+                for data_point in data_points
+            ),
+            dtype=PROCESSED_FIELDS_DTYPE,
+            count=len(data_points),
+        )
+        # numpy turns missing (None) values into NaN, which would silently corrupt everything calculated below, e.g. a
+        # NaN initial altitude would make every altitude NaN for the rest of the flight. So we fail loudly instead.
+        if np.isnan(data["linear_accel"]).any() or np.isnan(data["pressure_alt"]).any():
+            raise ValueError("EstimatedDataPackets must have linear acceleration and pressure altitude values")
+
+        self._data_points = data_points
+
+        # If the absolute value of acceleration is less than 0.1, set it to 0. This is done for all the data points
+        # and all the directions at once.
+        accelerations = deadband(data["linear_accel"], ACCELERATION_NOISE_THRESHOLD)
+        pressure_altitudes = data["pressure_alt"]
+
+        a_x, a_y, a_z = self._compute_averages(accelerations)
         self._avg_accel = (a_x, a_y, a_z)
-        self._avg_accel_mag = (a_x**2 + a_y**2 + a_z**2) ** 0.5
+        self._avg_accel_mag = math.hypot(a_x, a_y, a_z)
 
-        self._speeds: np.array[np.float64] = self._calculate_speeds(x_accel, y_accel, z_accel)
+        x_accel, y_accel, z_accel = accelerations.T
+        self._speeds: np.array[np.float64] = self._calculate_speeds(data["timestamp"], x_accel, y_accel, z_accel)
         self._max_speed = max(self._speeds.max(), self._max_speed)
 
         # Zero the altitude only once, during the first update:
@@ -147,7 +174,7 @@ class IMUDataProcessor:
             self._initial_altitude = np.mean(pressure_altitudes)
 
         self._current_altitudes = self._calculate_current_altitudes(pressure_altitudes)
-        self._max_altitude = self._calculate_max_altitude(pressure_altitudes)
+        self._max_altitude = self._calculate_max_altitude(self._current_altitudes)
 
         # Store the last data point for the next update
         self._last_data_point = data_points[-1]
@@ -174,17 +201,17 @@ class IMUDataProcessor:
             )
         ]
 
-    def _calculate_max_altitude(self, pressure_alt: Sequence[float]) -> float:
+    def _calculate_max_altitude(self, zeroed_alts: npt.NDArray[np.float64]) -> float:
         """
         Calculates the maximum altitude (zeroed out) of the rocket based on the pressure
         altitude during the flight.
 
+        :param zeroed_alts: The current altitudes, already zeroed out by _calculate_current_altitudes.
         :return: The maximum altitude of the rocket in meters.
         """
-        zeroed_alts = np.array(pressure_alt) - self._initial_altitude
         return max(zeroed_alts.max(), self._max_altitude)
 
-    def _calculate_current_altitudes(self, alt_list: Sequence[float]) -> npt.NDArray[np.float64]:
+    def _calculate_current_altitudes(self, alt_list: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
         """
         Calculates the current altitudes, by zeroing out the initial altitude.
 
@@ -192,25 +219,32 @@ class IMUDataProcessor:
         """
         # There is a decent chance that the zeroed out altitude is negative, e.g. if the rocket
         # landed at a height below from where it launched from, but that doesn't concern us.
-        return np.array(alt_list) - self._initial_altitude
+        return alt_list - self._initial_altitude
 
-    def _compute_averages(self, a_x: list[float], a_y: list[float], a_z: list[float]) -> tuple[float, float, float]:
+    def _compute_averages(self, accelerations: npt.NDArray[np.float64]) -> tuple[float, float, float]:
         """
         Calculates the average acceleration and acceleration magnitude of the data points.
 
-        :param a_x: A list of the accelerations in the x direction.
-        :param a_y: A list of the accelerations in the y direction.
-        :param a_z: A list of the accelerations in the z direction.
+        :param accelerations: An array with one row of x, y, and z accelerations per data point.
 
-        :return: A numpy array of the average acceleration in the x, y, and z directions.
+        :return: A tuple of the average acceleration in the x, y, and z directions.
         """
-        # calculate the average acceleration in the x, y, and z directions
-        return float(np.mean(a_x)), float(np.mean(a_y)), float(np.mean(a_z))
-
-    def _calculate_speeds(self, a_x: list[float], a_y: list[float], a_z: list[float]) -> npt.NDArray[np.float64]:
+        # calculate the average acceleration in the x, y, and z directions, all in one pass
+        a_x, a_y, a_z = accelerations.mean(axis=0)
+        return float(a_x), float(a_y), float(a_z)
+
+    def _calculate_speeds(
+        self,
+        timestamps: npt.NDArray[np.int64],
+        a_x: npt.NDArray[np.float64],
+        a_y: npt.NDArray[np.float64],
+        a_z: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
         """
         Calculates the speed of the rocket based on the linear acceleration.
         Integrates the linear acceleration to get the speed.
+
+        :param timestamps: The timestamps of the data points, in nanoseconds.
         """
         # We need at least two data points to calculate the speed:
         if len(self._data_points) < 1:
@@ -228,7 +262,7 @@ class IMUDataProcessor:
         # We are converting from ns to s, since we don't want to have a speed in m/ns^2
         # We are using the last data point to calculate the time difference between the last data point from the
         # previous loop, and the first data point from the current loop
-        time_diff = np.diff([data_point.timestamp for data_point in [self._last_data_point, *self._data_points]]) * 1e-9
+        time_diff = np.diff(timestamps, prepend=self._last_data_point.timestamp) * 1e-9
 
         # We store the previous calculated velocity vectors, so that our speed
         # doesn't show a jump, e.g. after motor burn out.
@@ -237,9 +271,9 @@ class IMUDataProcessor:
         # We integrate each of the components of the acceleration to get the velocity
         # The [:-1] is used to remove the last element of the list, since we have one less time
         # difference than we have acceleration values.
-        velocities_x: np.array = previous_vel_x + np.cumsum(np.array(a_x) * time_diff)
-        velocities_y: np.array = previous_vel_y + np.cumsum(np.array(a_y) * time_diff)
-        velocities_z: np.array = previous_vel_z + np.cumsum(np.array(a_z) * time_diff)
+        velocities_x: np.array = previous_vel_x + np.cumsum(a_x * time_diff)
+        velocities_y: np.array = previous_vel_y + np.cumsum(a_y * time_diff)
+        velocities_z: np.array = previous_vel_z + np.cumsum(a_z * time_diff)
 
         # Store the last calculated velocity vectors
         self._previous_velocity = (velocities_x[-1], velocities_y[-1], velocities_z[-1])
@@ -2,12 +2,24 @@
 
 import collections
 import csv
+import itertools
 import multiprocessing
+import queue
 import signal
 from pathlib import Path
 
+import msgspec
+
 from airbrakes.data_handling.logged_data_packet import LoggedDataPacket
-from constants import LOG_BUFFER_SIZE, LOG_CAPACITY_AT_STANDBY, STOP_SIGNAL
+from constants import (
+    LOG_BUFFER_SIZE,
+    LOG_CAPACITY_AT_STANDBY,
+    LOG_FILE_BUFFER_SIZE,
+    LOG_FLUSH_INTERVAL,
+    LOG_IDLE_FLUSH_TIMEOUT,
+    LOG_MAX_BATCHES_PER_WRITE,
+    STOP_SIGNAL,
+)
 
 
 class Logger:
@@ -27,25 +39,38 @@ class Logger:
     def __init__(self, log_dir: Path):
         log_dir.mkdir(parents=True, exist_ok=True)
 
-        # Get all existing log files and find the highest suffix number
-        existing_logs = list(log_dir.glob("log_*.csv"))
-        max_suffix = max(int(log.stem.split("_")[-1]) for log in existing_logs) if existing_logs else 0
+        # The number of the latest log file is kept in a small file in the log directory, so we don't have to look
+        # through every existing log file to find the next number.
+        sequence_file = log_dir / ".seq"
+        try:
+            log_number = int(sequence_file.read_text()) + 1
+        except (FileNotFoundError, ValueError):
+            log_number = None
+        # If the file doesn't exist yet, got corrupted (e.g. the pi lost power while writing it), or is behind the
+        # existing logs (e.g. it was reset), we never want to overwrite a log, so we get all existing log files and find
+        # the highest suffix number
+        if log_number is None or (log_dir / f"log_{log_number}.csv").exists():
+            existing_logs = list(log_dir.glob("log_*.csv"))
+            log_number = max(int(log.stem.split("_")[-1]) for log in existing_logs) + 1 if existing_logs else 1
+        sequence_file.write_text(str(log_number))
 
         # Buffer for StandbyState and LandedState
         self._log_counter = 0
         self._log_buffer = collections.deque(maxlen=LOG_BUFFER_SIZE)
 
-        # Create a new log file with the next number in sequence
-        self.log_path = log_dir / f"log_{max_suffix + 1}.csv"
-        with self.log_path.open(mode="w", newline="") as file_writer:
-            writer = csv.DictWriter(file_writer, fieldnames=LoggedDataPacket.__struct_fields__)
-            writer.writeheader()
+        # Create a new log file with the next number in sequence. "x" makes sure we never overwrite an existing log.
+        self.log_path = log_dir / f"log_{log_number}.csv"
+        with self.log_path.open(mode="x", newline="") as file_writer:
+            writer = csv.writer(file_writer)
+            writer.writerow(LoggedDataPacket.__struct_fields__)
 
         # Makes a queue to store log messages, basically it's a process-safe list that you add to
         # the back and pop from front, meaning that things will be logged in the order they were
         # added.
-        # Signals (like stop) are sent as strings, but data is sent as dictionaries
-        self._log_queue: multiprocessing.Queue[dict[str, str] | str] = multiprocessing.Queue()
+        # Signals (like stop) are sent as strings, but data is sent as lists of tuples, with the values in the same
+        # order as the headers of the CSV file. We send a whole batch of messages at once, so we only pay the pickling
+        # and locking cost of the queue once per call to log(), instead of once for every packet.
+        self._log_queue: multiprocessing.Queue[list[tuple] | str] = multiprocessing.Queue()
 
         # Start the logging process
         self._log_process = multiprocessing.Process(target=self._logging_loop, name="Logger")
@@ -76,29 +101,36 @@ class Logger:
         Logs the current state, extension, and IMU data to the CSV file.
         :param logged_data_packets: the list of IMU data packets to log
         """
+        # The messages which will be sent to the logging process in one go
+        message_batch: list[tuple] = []
+
         # Loop through all the IMU data packets
         for logged_data_packet in logged_data_packets:
-            # Formats the log message as a CSV line
-            message_dict = {key: getattr(logged_data_packet, key) for key in logged_data_packet.__struct_fields__}
+            # Formats the log message as a CSV line. astuple() gets all the fields in the order they are defined in,
+            # which is the order of the headers, without having to look up each field by name.
+            message = msgspec.structs.astuple(logged_data_packet)
 
             if logged_data_packet.state in ["S", "L"]:  # S: StandbyState, L: LandedState
                 if self._log_counter < LOG_CAPACITY_AT_STANDBY:
                     # add the count:
                     self._log_counter += 1
                 else:
-                    self._log_buffer.append(message_dict)
+                    self._log_buffer.append(message)
                     continue
             else:
                 if self._log_buffer:
                     # Log the buffer before logging the new message
-                    for buffered_message in self._log_buffer:
-                        self._log_queue.put(buffered_message)
+                    message_batch.extend(self._log_buffer)
                     self._log_buffer.clear()
 
                 self._log_counter = 0  # Reset the counter for other states
 
-            # Put the message in the queue
-            self._log_queue.put(message_dict)
+            # Add the message to the batch
+            message_batch.append(message)
+
+        # Put all the messages in the queue at once
+        if message_batch:
+            self._log_queue.put(message_batch)
 
     def _logging_loop(self) -> None:
         """
@@ -107,13 +139,42 @@ class Logger:
         # Ignore the SIGINT (Ctrl+C) signal, because we only want the main process to handle it
         signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ignores the interrupt signal
         # Set up the csv logging in the new process
-        with self.log_path.open(mode="a", newline="") as file_writer:
-            writer = csv.DictWriter(file_writer, fieldnames=LoggedDataPacket.__struct_fields__)
+        with self.log_path.open(mode="a", newline="", buffering=LOG_FILE_BUFFER_SIZE) as file_writer:
+            writer = csv.writer(file_writer)
+            writes_since_flush = 0
             while True:
                 # Get a message from the queue (this will block until a message is available)
-                # Because there's no timeout, it will wait indefinitely until it gets a message.
-                message_fields = self._log_queue.get()
-                # If the message is the stop signal, break out of the loop
-                if message_fields == STOP_SIGNAL:
+                # If no message comes for a while (e.g. in StandbyState once the log capacity is reached), we flush
+                # what we've written so far, so it isn't sitting in the buffer if the pi loses power, and keep waiting.
+                try:
+                    message_batches = [self._log_queue.get(timeout=LOG_IDLE_FLUSH_TIMEOUT)]
+                except queue.Empty:
+                    if writes_since_flush:
+                        file_writer.flush()
+                        writes_since_flush = 0
+                    continue
+
+                # Take whatever else is already waiting in the queue (up to a limit), so we can write it all at once
+                while len(message_batches) < LOG_MAX_BATCHES_PER_WRITE:
+                    try:
+                        message_batches.append(self._log_queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                # The stop signal is always the last thing put in the queue, so if we got it, it's at the end
+                stop_requested = message_batches[-1] == STOP_SIGNAL
+                if stop_requested:
+                    message_batches.pop()
+
+                writer.writerows(itertools.chain.from_iterable(message_batches))
+
+                # If the message is the stop signal, break out of the loop. The file is flushed when it's closed.
+                if stop_requested:
                     break
-                writer.writerow(message_fields)
+
+                # While we're busy logging, we only flush every so often, so we don't lose too much data if the pi
+                # loses power, without making a write syscall for every batch.
+                writes_since_flush += 1
+                if writes_since_flush >= LOG_FLUSH_INTERVAL:
+                    file_writer.flush()
+                    writes_since_flush = 0
@@ -1,7 +1,9 @@
 """Module for interacting with the IMU (Inertial measurement unit) on the rocket."""
 
 import collections
+import ctypes
 import multiprocessing
+import queue
 import signal
 import warnings
 
@@ -17,7 +19,7 @@ except ImportError:
     )
 
 from airbrakes.data_handling.imu_data_packet import EstimatedDataPacket, IMUDataPacket, RawDataPacket
-from constants import ESTIMATED_DESCRIPTOR_SET, MAX_QUEUE_SIZE, RAW_DESCRIPTOR_SET
+from constants import ESTIMATED_DESCRIPTOR_SET, MAX_QUEUE_SIZE, QUATERNION_CHANNELS, RAW_DESCRIPTOR_SET
 
 
 class IMU:
@@ -48,7 +50,10 @@ class IMU:
         # to prevent memory issues. Realistically, the queue size never exceeds 50 packets when
         # it's being logged.
         self._data_queue: multiprocessing.Queue[IMUDataPacket] = multiprocessing.Queue(MAX_QUEUE_SIZE)
-        self._running = multiprocessing.Value("b", False)  # Makes a boolean value that is shared between processes
+        # Makes a boolean value that is shared between processes. Only the main process ever writes to it, and
+        # writing a single byte is atomic, so it doesn't need a lock. This makes checking it in the fetch loop
+        # just a read from memory, instead of acquiring a lock every iteration.
+        self._running = multiprocessing.RawValue(ctypes.c_bool, False)
 
         # Starts the process that fetches data from the IMU
         self._data_fetch_process = multiprocessing.Process(
@@ -95,12 +100,13 @@ class IMU:
         """
         # We use a deque because it's faster than a list for popping from the left
         data_packets = collections.deque()
-        # While there is data in the queue, get the data packet and add it to the dequeue which we return
-        while not self._data_queue.empty():
-            data_packet = self.get_imu_data_packet()
-            data_packets.append(data_packet)
-
-        return data_packets
+        # While there is data in the queue, get the data packet and add it to the dequeue which we return.
+        # get_nowait() checks if there is data itself, so we don't need to call empty() for every packet
+        while True:
+            try:
+                data_packets.append(self._data_queue.get_nowait())
+            except queue.Empty:
+                return data_packets
 
     def _fetch_data_loop(self, port: str, frequency: int) -> None:
         """
@@ -115,6 +121,14 @@ class IMU:
         node = mscl.InertialNode(connection)
         timeout = int(1000 / frequency)
 
+        # Maps the descriptor set of a packet to the data packet class to make for it, and the names of the fields of
+        # that class. Checking if a channel is in one of these sets is a single hash lookup, which is much cheaper
+        # than calling hasattr() for every data point.
+        packet_types: dict[int, tuple[type[IMUDataPacket], frozenset[str]]] = {
+            ESTIMATED_DESCRIPTOR_SET: (EstimatedDataPacket, frozenset(EstimatedDataPacket.__struct_fields__)),
+            RAW_DESCRIPTOR_SET: (RawDataPacket, frozenset(RawDataPacket.__struct_fields__)),
+        }
+
         while self._running.value:
             # Get the latest data packets from the IMU, with the help of `getDataPackets`.
             # `getDataPackets` accepts a timeout in milliseconds.
@@ -129,17 +143,15 @@ class IMU:
                 # The data packet from the IMU:
                 packet: mscl.MipDataPacket
 
-                # Get the timestamp of the packet
-                timestamp = packet.collectedTimestamp().nanoseconds()
-
-                # Initialize packet with the timestamp, determines if the packet is raw or estimated
-                if packet.descriptorSet() == ESTIMATED_DESCRIPTOR_SET:
-                    imu_data_packet = EstimatedDataPacket(timestamp)
-                elif packet.descriptorSet() == RAW_DESCRIPTOR_SET:
-                    imu_data_packet = RawDataPacket(timestamp)
-                else:
+                # Determines if the packet is raw or estimated, only once for the whole packet
+                packet_type = packet_types.get(packet.descriptorSet())
+                if packet_type is None:
                     # This is an unknown packet, so we skip it
                     continue
+                packet_class, packet_fields = packet_type
+
+                # Initialize packet with the timestamp of the packet
+                imu_data_packet = packet_class(packet.collectedTimestamp().nanoseconds())
 
                 # Each of these packets has multiple data points
                 for data_point in packet.data():
@@ -148,23 +160,21 @@ class IMU:
                         channel = data_point.channelName()
                         # This cpp file was the only place I was able to find all the channel names
                         # https://github.com/LORD-MicroStrain/MSCL/blob/master/MSCL/source/mscl/MicroStrain/MIP/MipTypes.cpp
-                        # Check if the channel name is one we want to save
-                        if hasattr(imu_data_packet, channel) or "Quaternion" in channel:
-                            # First checks if the data point needs special handling, if not, just set the attribute
-                            match channel:
-                                # These specific data points are matrix's rather than doubles
-                                case "estAttitudeUncertQuaternion" | "estOrientQuaternion":
-                                    # This makes a 4x1 matrix from the data point with the data as [[w], [x], [y], [z]]
-                                    matrix = data_point.as_Matrix()
-                                    # Sets the W, X, Y, and Z of the quaternion to the data packet object
-                                    setattr(imu_data_packet, f"{channel}W", matrix.as_floatAt(0, 0))
-                                    setattr(imu_data_packet, f"{channel}X", matrix.as_floatAt(0, 1))
-                                    setattr(imu_data_packet, f"{channel}Y", matrix.as_floatAt(0, 2))
-                                    setattr(imu_data_packet, f"{channel}Z", matrix.as_floatAt(0, 3))
-                                case _:
-                                    # Because the attribute names in our data packet classes are the same as the channel
-                                    # names, we can just set the attribute to the value of the data point.
-                                    setattr(imu_data_packet, channel, data_point.as_float())
+                        # Check if the channel name is one we want to save, first checking if the data point
+                        # needs special handling
+                        if channel in QUATERNION_CHANNELS:
+                            # These specific data points are matrix's rather than doubles
+                            # This makes a 4x1 matrix from the data point with the data as [[w], [x], [y], [z]]
+                            matrix = data_point.as_Matrix()
+                            # Sets the W, X, Y, and Z of the quaternion to the data packet object
+                            setattr(imu_data_packet, f"{channel}W", matrix.as_floatAt(0, 0))
+                            setattr(imu_data_packet, f"{channel}X", matrix.as_floatAt(0, 1))
+                            setattr(imu_data_packet, f"{channel}Y", matrix.as_floatAt(0, 2))
+                            setattr(imu_data_packet, f"{channel}Z", matrix.as_floatAt(0, 3))
+                        elif channel in packet_fields:
+                            # Because the attribute names in our data packet classes are the same as the channel
+                            # names, we can just set the attribute to the value of the data point.
+                            setattr(imu_data_packet, channel, data_point.as_float())
 
                 # Put the latest data into the shared queue
                 self._data_queue.put(imu_data_packet)
@@ -1,8 +1,11 @@
 """File which contains a few basic utility functions which can be reused in the project."""
 
 import time
+from math import fabs
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from airbrakes.airbrakes import AirbrakesContext
 
@@ -10,7 +13,7 @@ if TYPE_CHECKING:
 MOVE_CURSOR_UP = "\033[F"  # Move the cursor one line up
 
 
-def convert_to_nanoseconds(value) -> int:
+def convert_to_nanoseconds(value) -> int | None:
     """Converts seconds to nanoseconds, if `value` is in float."""
     try:
         return int(float(value) * 1e9)
@@ -26,15 +29,18 @@ def convert_to_float(value) -> float | None:
         return None  # Return None if the conversion fails
 
 
-def deadband(input_value, threshold) -> float:
+def deadband(input_value, threshold) -> float | np.ndarray:
     """
     Returns 0 if the input_value is within the deadband threshold.
     Otherwise, returns the input_value adjusted by the threshold.
-    :param input_value: The value to apply the deadband to.
+    If input_value is a numpy array, the deadband is applied to every element of it at once.
+    :param input_value: The value (or numpy array of values) to apply the deadband to.
     :param threshold: The deadband threshold.
     :return: Adjusted input_value or 0 if within the deadband.
     """
-    if abs(input_value) < threshold:
+    if isinstance(input_value, np.ndarray):
+        return np.where(np.abs(input_value) < threshold, 0.0, input_value)
+    if fabs(input_value) < threshold:
         return 0.0
     return input_value
 
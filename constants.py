@@ -13,6 +13,9 @@ REAL_SERVO_ARGUMENT = "rs"
 SIMULATION_LOG_PATH = Path("scripts/imu_data/winter_2023_launch_data.csv")
 # SIMULATION_LOG_PATH = Path("logs/2023-11-18_18_21_52_mergedLORDlog.csv")
 
+# The CPU core the main loop is pinned to on the pi, so the IMU and logger processes don't compete with it
+CONTROL_LOOP_CPU = 3
+
 # -------------------------------------------------------
 # Servo Configuration
 # -------------------------------------------------------
@@ -51,6 +54,9 @@ FREQUENCY = 100  # TODO: Remove this since we don't/can't control the frequency
 ESTIMATED_DESCRIPTOR_SET = 130
 RAW_DESCRIPTOR_SET = 128
 
+# The channels of the data points from the IMU which are quaternions (4x1 matrices) rather than doubles
+QUATERNION_CHANNELS = frozenset({"estAttitudeUncertQuaternion", "estOrientQuaternion"})
+
 # The maximum size of the data queue for the packets, so we don't run into memory issues
 MAX_QUEUE_SIZE = 100000
 
@@ -73,6 +79,17 @@ TEST_LOGS_PATH = Path("test_logs")
 # see stop() and _logging_loop() for more details.
 STOP_SIGNAL = "STOP"
 
+# The most batches of messages the logging process takes from the queue before writing them to the file at once
+LOG_MAX_BATCHES_PER_WRITE = 256
+# The size of the buffer for the log file in bytes, so we don't make a write syscall for every line
+LOG_FILE_BUFFER_SIZE = 1 << 20  # 1 MiB
+# How many writes to the log file before we flush it while the logger is busy, so we don't lose too much data if the pi
+# loses power.
+LOG_FLUSH_INTERVAL = 100
+# How long in seconds the logger waits for new data before flushing what it has written, e.g. when nothing is being
+# logged in StandbyState or LandedState
+LOG_IDLE_FLUSH_TIMEOUT = 0.5
+
 DATA_PACKET_DECIMAL_PLACES = 8
 
 # Don't log more than x packets for StandbyState and LandedState
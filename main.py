@@ -1,6 +1,7 @@
 """The main file which will be run on the Raspberry Pi. It will create the AirbrakesContext object and run the main
 loop."""
 
+import os
 import sys
 import time
 
@@ -14,6 +15,7 @@ from airbrakes.hardware.servo import Servo
 from airbrakes.mock.mock_imu import MockIMU
 from airbrakes.utils import update_display
 from constants import (
+    CONTROL_LOOP_CPU,
     FREQUENCY,
     LOGS_PATH,
     MOCK_ARGUMENT,
@@ -42,8 +44,20 @@ def main(is_simulation: bool, real_servo: bool) -> None:
     # The context that will manage the airbrakes state machine
     airbrakes = AirbrakesContext(servo, imu, logger, data_processor)
 
+    # The cores this process is allowed to run on, if the platform lets us control that
+    available_cpus = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else set()
+    # Only pin the main loop on the pi, and only if it can have a core to itself
+    pin_main_loop = not is_simulation and CONTROL_LOOP_CPU in available_cpus and len(available_cpus) > 1
+
     try:
+        if pin_main_loop:
+            # The IMU and logger processes run on the same cores as the main process when they start, so we
+            # first keep the main process off the main loop's core
+            os.sched_setaffinity(0, available_cpus - {CONTROL_LOOP_CPU})
         airbrakes.start()  # Start the IMU and logger processes
+        if pin_main_loop:
+            # Now move the main process onto its own core, so it isn't interrupted by the other processes
+            os.sched_setaffinity(0, {CONTROL_LOOP_CPU})
         # This is the main loop that will run until we press Ctrl+C
         while not airbrakes.shutdown_requested:
             airbrakes.update()
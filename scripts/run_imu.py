@@ -4,6 +4,8 @@ Make sure you are in the root directory of the project, not inside scripts, and
 For the pi, you will have to use python3
 """
 
+import time
+
 from constants import FREQUENCY, PORT, TEST_LOGS_PATH
 from airbrakes.hardware.imu import IMU
 from airbrakes.data_handling.logger import Logger
@@ -16,7 +18,10 @@ try:
     imu.start()
     logger.start()
     while True:
-        imu.get_imu_data_packet()
+        # Gets all the packets which are available at once, instead of one at a time. If there aren't any yet, we
+        # wait for about one packet's worth of time, so we don't spin a whole core checking an empty queue.
+        if not imu.get_imu_data_packets():
+            time.sleep(1 / FREQUENCY)
 except KeyboardInterrupt:  # Stop running IMU and logger if the user presses Ctrl+C
     pass
 finally:
@@ -20,6 +20,7 @@ def logger():
     """Clear the tests/logs directory before making a new Logger."""
     for log in LOG_PATH.glob("log_*.csv"):
         log.unlink()
+    (LOG_PATH / ".seq").unlink(missing_ok=True)
     return Logger(LOG_PATH)
 
 
@@ -154,10 +154,38 @@ class TestIMUDataProcessor:
         assert d._initial_altitude == 20.5
         assert d.speed == pytest.approx(np.sqrt(2**2 + 4**2 + 6**2)) == d.max_speed
 
+    def test_acceleration_deadband(self):
+        """Tests whether accelerations within the noise threshold are ignored in the averages."""
+        d = IMUDataProcessor(
+            [
+                EstimatedDataPacket(1, estLinearAccelX=0.1, estLinearAccelY=-0.2, estLinearAccelZ=2, estPressureAlt=20),
+                EstimatedDataPacket(2, estLinearAccelX=0.3, estLinearAccelY=-1, estLinearAccelZ=4, estPressureAlt=21),
+            ]
+        )
+        assert d.avg_acceleration == (0.0, -0.5, 3.0)
+
+    @pytest.mark.parametrize(
+        "packet",
+        [
+            EstimatedDataPacket(3, estLinearAccelY=2, estLinearAccelZ=3, estPressureAlt=20),
+            EstimatedDataPacket(3, estLinearAccelX=1, estLinearAccelY=2, estLinearAccelZ=3),
+        ],
+        ids=["missing_acceleration", "missing_altitude"],
+    )
+    def test_update_data_missing_values(self, packet):
+        """Tests whether packets with missing values raise an error, instead of silently corrupting the data."""
+        d = IMUDataProcessor([])
+        with pytest.raises(ValueError, match="must have linear acceleration and pressure altitude"):
+            d.update_data([packet])
+        # Nothing was updated with the bad data
+        assert d._initial_altitude is None
+        assert d._data_points == []
+        assert d._avg_accel == (0.0, 0.0, 0.0)
+
     def test_calculate_speeds_no_data(self):
         """Test that speeds are not handled when there are no data points."""
         d = IMUDataProcessor([])
-        speeds = d._calculate_speeds([], [], [])
+        speeds = d._calculate_speeds([], [], [], [])
         assert speeds == [0.0], "Speeds should return [0.0] when no data points are present."
 
     def test_previous_velocity_retained(self, data_processor):
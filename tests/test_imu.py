@@ -1,5 +1,5 @@
+import ctypes
 import multiprocessing
-import multiprocessing.sharedctypes
 import signal
 import time
 from collections import deque
@@ -24,8 +24,9 @@ class TestIMU:
 
     def test_init(self, imu):
         assert isinstance(imu._data_queue, multiprocessing.queues.Queue)
-        # Test that _running is a shared boolean multiprocessing.Value:
-        assert isinstance(imu._running, multiprocessing.sharedctypes.Synchronized)
+        # Test that _running is a shared boolean multiprocessing.RawValue:
+        assert isinstance(imu._running, ctypes.c_bool)
+        assert imu._running.value is False
         assert isinstance(imu._data_fetch_process, multiprocessing.Process)
 
     def test_imu_start(self, monkeypatch):
@@ -4,13 +4,14 @@ import multiprocessing.sharedctypes
 import signal
 import time
 
+import msgspec
 import pytest
 
 from airbrakes.data_handling.imu_data_packet import EstimatedDataPacket, RawDataPacket
 from airbrakes.data_handling.logged_data_packet import LoggedDataPacket
 from airbrakes.data_handling.logger import Logger
 from airbrakes.data_handling.processed_data_packet import ProcessedDataPacket
-from constants import LOG_CAPACITY_AT_STANDBY, STOP_SIGNAL
+from constants import LOG_CAPACITY_AT_STANDBY, LOG_IDLE_FLUSH_TIMEOUT, STOP_SIGNAL
 from tests.conftest import LOG_PATH
 
 
@@ -24,6 +25,7 @@ class TestLogger:
         # Test run is over, now clean up
         for log in LOG_PATH.glob("log_*.csv"):
             log.unlink()
+        (LOG_PATH / ".seq").unlink(missing_ok=True)
 
     def test_slots(self, logger):
         inst = logger
@@ -58,6 +60,31 @@ class TestLogger:
         # Test only 2 csv files exist:
         assert set(LOG_PATH.glob("log_*.csv")) == {expected_log_path, expected_log_path_2}
 
+    def test_init_log_path_without_sequence_file(self, logger):
+        """Tests whether the log number continues from the existing logs if the sequence file is missing or
+        corrupted."""
+        assert logger.log_path == LOG_PATH / "log_1.csv"
+        (LOG_PATH / ".seq").unlink()
+        logger_2 = Logger(LOG_PATH)
+        assert logger_2.log_path == LOG_PATH / "log_2.csv"
+        (LOG_PATH / ".seq").write_text("")
+        logger_3 = Logger(LOG_PATH)
+        assert logger_3.log_path == LOG_PATH / "log_3.csv"
+        assert (LOG_PATH / ".seq").read_text() == "3"
+
+    def test_init_sequence_file_behind_existing_logs(self, logger):
+        """Tests whether an out of date sequence file never makes the logger overwrite an existing log."""
+        logger_2 = Logger(LOG_PATH)
+        logger_2.log_path.write_text("flight data\n")
+        (LOG_PATH / ".seq").write_text("0")
+        logger_3 = Logger(LOG_PATH)
+        assert logger_3.log_path == LOG_PATH / "log_3.csv"
+        assert (LOG_PATH / ".seq").read_text() == "3"
+        # The existing logs are untouched
+        assert logger_2.log_path.read_text() == "flight data\n"
+        with logger.log_path.open() as f:
+            assert tuple(next(csv.reader(f))) == LoggedDataPacket.__struct_fields__
+
     def test_init_log_file_has_correct_headers(self, logger):
         with logger.log_path.open() as f:
             reader = csv.reader(f)
@@ -127,7 +154,7 @@ class TestLogger:
 
     def test_logging_loop_add_to_queue(self, logger):
         test_log = {"state": "state", "extension": "0.0", "timestamp": "4"}
-        logger._log_queue.put(test_log)
+        logger._log_queue.put([tuple(test_log.values())])
         assert logger._log_queue.qsize() == 1
         logger.start()
         time.sleep(0.05)  # Give the process time to log to file
@@ -145,6 +172,55 @@ class TestLogger:
 
             assert row_dict == test_log
 
+    def test_logging_loop_drains_queue_into_one_write(self, logger, monkeypatch):
+        """Tests whether the batches waiting in the queue are all written, in order, with a single write."""
+        write_sizes = multiprocessing.Queue()
+        csv_writer = csv.writer
+
+        class RecordingWriter:
+            """Wraps the csv writer to record how many rows each writerows() call writes."""
+
+            def __init__(self, file):
+                self._writer = csv_writer(file)
+
+            def writerows(self, rows):
+                rows = list(rows)
+                write_sizes.put(len(rows))
+                self._writer.writerows(rows)
+
+        monkeypatch.setattr(csv, "writer", RecordingWriter)
+
+        for i in range(3):
+            logger._log_queue.put([("M", "0.0", f"{i}{j}") for j in range(2)])
+        time.sleep(0.05)  # Give the queue's feeder thread time to put the batches
+        logger.start()
+        logger.stop()
+
+        # All 3 batches were written at once
+        assert write_sizes.get() == 6
+        with logger.log_path.open() as f:
+            reader = csv.DictReader(f)
+            timestamps = [row["timestamp"] for row in reader]
+        assert timestamps == ["00", "01", "10", "11", "20", "21"]
+
+    def test_logging_loop_flushes_when_idle(self, logger):
+        """Tests whether the logged data is flushed to the file once no new data has come for a while, instead of
+        sitting in the file buffer while the logger waits for more data."""
+        logger.start()
+        logger.log([LoggedDataPacket(state="S", extension=0.0, timestamp=1.0)])
+        time.sleep(0.1)  # Give the process time to log to file
+        # Read the file while the logger is still running, the data is still buffered
+        with logger.log_path.open() as f:
+            rows = list(csv.reader(f))
+        assert len(rows) == 1  # Only the headers
+
+        time.sleep(LOG_IDLE_FLUSH_TIMEOUT + 0.1)  # Wait until the logger has been idle long enough to flush
+        with logger.log_path.open() as f:
+            rows = list(csv.reader(f))
+        logger.stop()
+        assert len(rows) == 2  # The headers and the logged packet
+        assert rows[1][:3] == ["S", "0.0", "1.0"]
+
     # This decorator is used to run the same test with different data
     # read more about it here: https://docs.pytest.org/en/stable/parametrize.html
     @pytest.mark.parametrize(
@@ -186,6 +262,16 @@ class TestLogger:
                 **{attr: str(getattr(data_packet, attr)) for attr in processed_data_packet_fields},
             }
 
+    def test_log_sends_one_batch(self, logger):
+        """Tests whether the log method puts all the packets in the queue as a single batch."""
+        log_packets = [LoggedDataPacket(state="M", extension=0.0, timestamp=float(i)) for i in range(10)]
+        logger.log(log_packets)
+        time.sleep(0.01)  # Give the queue's feeder thread time to put the batch
+        assert logger._log_queue.qsize() == 1
+        batch = logger._log_queue.get()
+        assert len(batch) == 10
+        assert batch == [msgspec.structs.astuple(log_packet) for log_packet in log_packets]
+
     def test_log_buffer_exceeded_standby(self, logger):
         """Tests whether the log buffer works correctly for the Standby and Landed state."""
 
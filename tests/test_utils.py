@@ -0,0 +1,76 @@
+import math
+
+import numpy as np
+import pytest
+
+from airbrakes.utils import convert_to_float, convert_to_nanoseconds, deadband
+
+
+class TestConvertToNanoseconds:
+    """Tests the convert_to_nanoseconds() function in utils.py"""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("1.5", 1_500_000_000),
+            (2, 2_000_000_000),
+            (0.25, 250_000_000),
+            (math.nan, None),
+            ("nan", None),
+            ("not a number", None),
+            ("", None),
+            (None, None),
+        ],
+        ids=["str", "int", "float", "nan", "nan_str", "garbage", "empty_str", "none"],
+    )
+    def test_convert_to_nanoseconds(self, value, expected):
+        assert convert_to_nanoseconds(value) == expected
+
+
+class TestConvertToFloat:
+    """Tests the convert_to_float() function in utils.py"""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("1.5", 1.5),
+            ("-0.00574072", -0.00574072),
+            (2, 2.0),
+            (0.0, 0.0),
+            ("not a number", None),
+            ("", None),
+            (None, None),
+        ],
+        ids=["str", "negative_str", "int", "float", "garbage", "empty_str", "none"],
+    )
+    def test_convert_to_float(self, value, expected):
+        result = convert_to_float(value)
+        assert result == expected
+        assert result is None or isinstance(result, float)
+
+
+class TestDeadband:
+    """Tests the deadband() function in utils.py"""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (0.1, 0.0),
+            (-0.1, 0.0),
+            (0.35, 0.35),
+            (-2.0, -2.0),
+            (1, 1),
+            (0, 0.0),
+        ],
+        ids=["small_positive", "small_negative", "at_threshold", "large_negative", "int", "zero"],
+    )
+    def test_deadband_scalar(self, value, expected):
+        assert deadband(value, 0.35) == expected
+
+    def test_deadband_array(self):
+        values = np.array([[0.1, -0.2, 2.0], [0.35, -1.0, -0.34]])
+        result = deadband(values, 0.35)
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == [[0.0, 0.0, 2.0], [0.35, -1.0, 0.0]]
+        # The input array is not modified
+        assert values.tolist() == [[0.1, -0.2, 2.0], [0.35, -1.0, -0.34]]